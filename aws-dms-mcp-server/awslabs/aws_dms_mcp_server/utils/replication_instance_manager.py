@@ -24,6 +24,37 @@ from loguru import logger
 from typing import Any, Dict, List, Optional
 
 
+# Common DMS instance classes
+VALID_INSTANCE_CLASSES = frozenset(
+    {
+        'dms.t2.micro',
+        'dms.t2.small',
+        'dms.t2.medium',
+        'dms.t2.large',
+        'dms.t3.micro',
+        'dms.t3.small',
+        'dms.t3.medium',
+        'dms.t3.large',
+        'dms.c4.large',
+        'dms.c4.xlarge',
+        'dms.c4.2xlarge',
+        'dms.c4.4xlarge',
+        'dms.c5.large',
+        'dms.c5.xlarge',
+        'dms.c5.2xlarge',
+        'dms.c5.4xlarge',
+        'dms.r4.large',
+        'dms.r4.xlarge',
+        'dms.r4.2xlarge',
+        'dms.r4.4xlarge',
+        'dms.r5.large',
+        'dms.r5.xlarge',
+        'dms.r5.2xlarge',
+        'dms.r5.4xlarge',
+    }
+)
+
+
 class ReplicationInstanceManager:
     """Manager for replication instance operations."""
 
@@ -174,35 +205,7 @@ class ReplicationInstanceManager:
         Returns:
             True if valid
         """
-        # Common DMS instance classes
-        valid_classes = [
-            'dms.t2.micro',
-            'dms.t2.small',
-            'dms.t2.medium',
-            'dms.t2.large',
-            'dms.t3.micro',
-            'dms.t3.small',
-            'dms.t3.medium',
-            'dms.t3.large',
-            'dms.c4.large',
-            'dms.c4.xlarge',
-            'dms.c4.2xlarge',
-            'dms.c4.4xlarge',
-            'dms.c5.large',
-            'dms.c5.xlarge',
-            'dms.c5.2xlarge',
-            'dms.c5.4xlarge',
-            'dms.r4.large',
-            'dms.r4.xlarge',
-            'dms.r4.2xlarge',
-            'dms.r4.4xlarge',
-            'dms.r5.large',
-            'dms.r5.xlarge',
-            'dms.r5.2xlarge',
-            'dms.r5.4xlarge',
-        ]
-
-        return instance_class in valid_classes
+        return instance_class in VALID_INSTANCE_CLASSES
 
     def modify_instance(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Modify replication instance.
@@ -1,11 +1,24 @@
 """Pytest configuration and fixtures for AWS DMS MCP Server tests."""
 
+import functools
 import pytest
 from awslabs.aws_dms_mcp_server.config import DMSServerConfig
 from awslabs.aws_dms_mcp_server.utils.dms_client import DMSClient
 from unittest.mock import MagicMock, Mock
 
 
+# Shared assertion helpers should report rich diffs like inline asserts.
+pytest.register_assert_rewrite('tests.utils')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Run benchmarks in-process, since codspeed drops results from xdist workers."""
+    if getattr(config.option, 'codspeed', False):
+        config.option.numprocesses = 0
+        config.option.dist = 'no'
+
+
 @pytest.fixture
 def mock_config():
     """Provide a test configuration.
@@ -33,6 +46,66 @@ def mock_dms_client(mock_config):
     return client
 
 
+@pytest.fixture(scope='session')
+def manager_factory():
+    """Provide a factory that builds a manager around a DMS client.
+
+    Managers are memoized per (manager class, client) pair, so repeated
+    requests for the same client reuse a single instance.
+
+    Returns:
+        Callable taking a manager class and a client, returning the manager
+    """
+
+    @functools.cache
+    def _make(manager_cls, client):
+        return manager_cls(client)
+
+    return _make
+
+
+@pytest.fixture(scope='session')
+def _shared_fake_client():
+    """Provide the fake DMS client instance shared across the session.
+
+    Module-scoped manager fixtures build on it; tests should request
+    ``fake_client`` instead, which resets it first.
+
+    Returns:
+        FakeClient instance
+    """
+    # Imported here so the assertion rewrite hook registered above applies.
+    from tests.utils import FakeClient
+
+    return FakeClient()
+
+
+@pytest.fixture
+def fake_client(_shared_fake_client):
+    """Provide the shared fake DMS client with canned responses and calls cleared.
+
+    Returns:
+        FakeClient instance
+    """
+    _shared_fake_client.reset()
+    return _shared_fake_client
+
+
+@pytest.fixture(scope='session')
+def server_mod():
+    """Provide the server module with tool handlers exposed as plain functions.
+
+    Call ``create_server`` on it before invoking handlers.
+
+    Returns:
+        ToolHandlers view of awslabs.aws_dms_mcp_server.server
+    """
+    from awslabs.aws_dms_mcp_server import server
+    from tests.utils import ToolHandlers
+
+    return ToolHandlers(server)
+
+
 @pytest.fixture
 def mock_boto3_client():
     """Provide a mocked boto3 DMS client.
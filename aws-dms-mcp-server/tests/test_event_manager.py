@@ -16,9 +16,17 @@
 
 import pytest
 from awslabs.aws_dms_mcp_server.utils.event_manager import EventManager
+from tests.utils import assert_ok
 from unittest.mock import Mock
 
 
+_TAGS = ({'Key': 'Environment', 'Value': 'Test'},)
+_SOURCE_IDS = ('instance-1', 'instance-2')
+_EVENT_CATEGORIES = ('failure', 'deletion')
+_MANY_SOURCE_IDS = ('id-1', 'id-2', 'id-3', 'id-4', 'id-5')
+_MANY_EVENT_CATEGORIES = ('failure', 'creation', 'deletion', 'configuration change')
+
+
 class TestEventManagerCreateSubscription:
     """Test event subscription creation."""
 
@@ -42,32 +50,30 @@ class TestEventManagerCreateSubscription:
             'test-subscription', 'arn:aws:sns:us-east-1:123456789012:test-topic'
         )
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Event subscription created successfully'
+        assert_ok(result, message='Event subscription created successfully')
         assert 'event_subscription' in result['data']
 
     def test_create_event_subscription_with_all_params(self, manager, mock_client):
         """Test event subscription creation with all parameters."""
         mock_client.call_api.return_value = {'EventSubscription': {}}
 
-        tags = [{'Key': 'Environment', 'Value': 'Test'}]
         result = manager.create_event_subscription(
             'test-subscription',
             'arn:aws:sns:us-east-1:123456789012:test-topic',
             source_type='replication-instance',
-            event_categories=['failure', 'deletion'],
-            source_ids=['instance-1', 'instance-2'],
+            event_categories=list(_EVENT_CATEGORIES),
+            source_ids=list(_SOURCE_IDS),
             enabled=True,
-            tags=tags,
+            tags=list(_TAGS),
         )
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['SourceType'] == 'replication-instance'
-        assert call_args['EventCategories'] == ['failure', 'deletion']
-        assert call_args['SourceIds'] == ['instance-1', 'instance-2']
+        assert call_args['EventCategories'] == list(_EVENT_CATEGORIES)
+        assert call_args['SourceIds'] == list(_SOURCE_IDS)
         assert call_args['Enabled'] is True
-        assert call_args['Tags'] == tags
+        assert call_args['Tags'] == list(_TAGS)
 
     def test_create_event_subscription_minimal_params(self, manager, mock_client):
         """Test event subscription creation with minimal parameters."""
@@ -75,7 +81,7 @@ class TestEventManagerCreateSubscription:
 
         result = manager.create_event_subscription('test-sub', 'arn:sns:topic')
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['SubscriptionName'] == 'test-sub'
         assert call_args['SnsTopicArn'] == 'arn:sns:topic'
@@ -88,7 +94,7 @@ class TestEventManagerCreateSubscription:
 
         result = manager.create_event_subscription('test-sub', 'arn:sns:topic', enabled=False)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['Enabled'] is False
 
@@ -114,8 +120,7 @@ class TestEventManagerModifySubscription:
 
         result = manager.modify_event_subscription('test-subscription')
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Event subscription modified successfully'
+        assert_ok(result, message='Event subscription modified successfully')
 
     def test_modify_event_subscription_all_params(self, manager, mock_client):
         """Test subscription modification with all parameters."""
@@ -129,7 +134,7 @@ class TestEventManagerModifySubscription:
             enabled=False,
         )
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['SnsTopicArn'] == 'arn:new:topic'
         assert call_args['SourceType'] == 'replication-task'
@@ -142,7 +147,7 @@ class TestEventManagerModifySubscription:
 
         result = manager.modify_event_subscription('test-sub', enabled=True)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['Enabled'] is True
         assert 'SnsTopicArn' not in call_args
@@ -169,8 +174,7 @@ class TestEventManagerDeleteSubscription:
 
         result = manager.delete_event_subscription('test-subscription')
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Event subscription deleted successfully'
+        assert_ok(result, message='Event subscription deleted successfully')
         mock_client.call_api.assert_called_once_with(
             'delete_event_subscription', SubscriptionName='test-subscription'
         )
@@ -200,48 +204,34 @@ class TestEventManagerListSubscriptions:
 
         result = manager.list_event_subscriptions()
 
-        assert result['success'] is True
-        assert result['data']['count'] == 2
+        assert_ok(result, count=2)
         assert len(result['data']['event_subscriptions']) == 2
 
-    def test_list_event_subscriptions_with_filters(self, manager, mock_client):
-        """Test subscriptions listing with filters."""
-        mock_client.call_api.return_value = {'EventSubscriptionsList': []}
-
+    def test_list_event_subscriptions_variants(self, manager, mock_client):
+        """Test subscriptions listing across pagination, filters and empty results."""
+        mock_client.call_api.side_effect = [
+            {'EventSubscriptionsList': [], 'Marker': 'next-token'},
+            {'EventSubscriptionsList': [{'SubscriptionName': 'sub-1'}]},
+            {'EventSubscriptionsList': []},
+        ]
         filters = [{'Name': 'enabled', 'Values': ['true']}]
-        result = manager.list_event_subscriptions(
+
+        paginated = manager.list_event_subscriptions()
+        filtered = manager.list_event_subscriptions(
             subscription_name='test-sub', filters=filters, max_results=50, marker='token'
         )
+        filtered_call_args = mock_client.call_api.call_args[1]
+        empty = manager.list_event_subscriptions()
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['SubscriptionName'] == 'test-sub'
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 50
-        assert call_args['Marker'] == 'token'
-
-    def test_list_event_subscriptions_with_pagination(self, manager, mock_client):
-        """Test subscriptions listing with pagination."""
-        mock_client.call_api.return_value = {
-            'EventSubscriptionsList': [],
-            'Marker': 'next-token',
-        }
-
-        result = manager.list_event_subscriptions()
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-        assert result['data']['next_marker'] == 'next-token'
-
-    def test_list_event_subscriptions_empty_result(self, manager, mock_client):
-        """Test subscriptions listing with empty result."""
-        mock_client.call_api.return_value = {'EventSubscriptionsList': []}
-
-        result = manager.list_event_subscriptions()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['event_subscriptions'] == []
+        assert_ok(paginated, next_marker='next-token')
+        assert_ok(filtered, count=1)
+        assert filtered_call_args['SubscriptionName'] == 'test-sub'
+        assert filtered_call_args['Filters'] == filters
+        assert filtered_call_args['MaxRecords'] == 50
+        assert filtered_call_args['Marker'] == 'token'
+        assert_ok(empty, count=0, event_subscriptions=[])
+        assert 'next_marker' not in empty['data']
+        assert mock_client.call_api.call_count == 3
 
 
 class TestEventManagerListEvents:
@@ -265,8 +255,7 @@ class TestEventManagerListEvents:
 
         result = manager.list_events()
 
-        assert result['success'] is True
-        assert result['data']['count'] == 2
+        assert_ok(result, count=2)
         assert len(result['data']['events']) == 2
 
     def test_list_events_with_all_params(self, manager, mock_client):
@@ -286,7 +275,7 @@ class TestEventManagerListEvents:
             marker='token',
         )
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['SourceIdentifier'] == 'instance-1'
         assert call_args['SourceType'] == 'replication-instance'
@@ -301,42 +290,32 @@ class TestEventManagerListEvents:
 
         result = manager.list_events()
 
-        assert result['success'] is True
+        assert_ok(result)
         assert 'next_marker' in result['data']
         assert result['data']['next_marker'] == 'next-token'
 
-    def test_list_events_by_source_identifier(self, manager, mock_client):
-        """Test events listing by source identifier."""
+    @pytest.mark.parametrize(
+        'kwargs,expected_params',
+        [
+            ({'source_identifier': 'task-1'}, {'SourceIdentifier': 'task-1'}),
+            (
+                {'start_time': '2024-01-01T00:00:00Z', 'end_time': '2024-01-02T00:00:00Z'},
+                {'StartTime': '2024-01-01T00:00:00Z', 'EndTime': '2024-01-02T00:00:00Z'},
+            ),
+            ({'duration': 120}, {'Duration': 120}),
+        ],
+        ids=['source_identifier', 'time_range', 'duration'],
+    )
+    def test_list_events_query(self, manager, mock_client, kwargs, expected_params):
+        """Test events listing by individual query parameters."""
         mock_client.call_api.return_value = {'Events': []}
 
-        result = manager.list_events(source_identifier='task-1')
+        result = manager.list_events(**kwargs)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
-        assert call_args['SourceIdentifier'] == 'task-1'
-
-    def test_list_events_by_time_range(self, manager, mock_client):
-        """Test events listing by time range."""
-        mock_client.call_api.return_value = {'Events': []}
-
-        result = manager.list_events(
-            start_time='2024-01-01T00:00:00Z', end_time='2024-01-02T00:00:00Z'
-        )
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['StartTime'] == '2024-01-01T00:00:00Z'
-        assert call_args['EndTime'] == '2024-01-02T00:00:00Z'
-
-    def test_list_events_by_duration(self, manager, mock_client):
-        """Test events listing by duration."""
-        mock_client.call_api.return_value = {'Events': []}
-
-        result = manager.list_events(duration=120)
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Duration'] == 120
+        for key, value in expected_params.items():
+            assert call_args[key] == value
 
 
 class TestEventManagerListEventCategories:
@@ -352,50 +331,41 @@ class TestEventManagerListEventCategories:
         """Create EventManager instance."""
         return EventManager(mock_client)
 
-    def test_list_event_categories_success(self, manager, mock_client):
-        """Test successful event categories listing."""
-        mock_client.call_api.return_value = {
-            'EventCategoryGroupList': [
-                {'SourceType': 'replication-instance', 'EventCategories': ['failure']},
-                {'SourceType': 'replication-task', 'EventCategories': ['deletion']},
-            ]
-        }
-
-        result = manager.list_event_categories()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['event_category_groups']) == 2
-
-    def test_list_event_categories_with_source_type(self, manager, mock_client):
-        """Test event categories listing with source type."""
-        mock_client.call_api.return_value = {'EventCategoryGroupList': []}
-
-        result = manager.list_event_categories(source_type='replication-instance')
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['SourceType'] == 'replication-instance'
-
-    def test_list_event_categories_with_filters(self, manager, mock_client):
-        """Test event categories listing with filters."""
-        mock_client.call_api.return_value = {'EventCategoryGroupList': []}
-
-        filters = [{'Name': 'source-type', 'Values': ['replication-task']}]
-        result = manager.list_event_categories(filters=filters)
-
-        assert result['success'] is True
+    @pytest.mark.parametrize(
+        'kwargs,groups,expected_params',
+        [
+            (
+                {},
+                [
+                    {'SourceType': 'replication-instance', 'EventCategories': ['failure']},
+                    {'SourceType': 'replication-task', 'EventCategories': ['deletion']},
+                ],
+                {},
+            ),
+            (
+                {'source_type': 'replication-instance'},
+                [],
+                {'SourceType': 'replication-instance'},
+            ),
+            (
+                {'filters': [{'Name': 'source-type', 'Values': ['replication-task']}]},
+                [],
+                {'Filters': [{'Name': 'source-type', 'Values': ['replication-task']}]},
+            ),
+            ({}, [], {}),
+        ],
+        ids=['basic', 'source_type', 'filters', 'empty'],
+    )
+    def test_list_event_categories(self, manager, mock_client, kwargs, groups, expected_params):
+        """Test event categories listing across parameter combinations."""
+        mock_client.call_api.return_value = {'EventCategoryGroupList': groups}
+
+        result = manager.list_event_categories(**kwargs)
+
+        assert_ok(result, count=len(groups), event_category_groups=groups)
         call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-
-    def test_list_event_categories_empty_result(self, manager, mock_client):
-        """Test event categories listing with empty result."""
-        mock_client.call_api.return_value = {'EventCategoryGroupList': []}
-
-        result = manager.list_event_categories()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
+        for key, value in expected_params.items():
+            assert call_args[key] == value
 
 
 class TestEventManagerUpdateToEventBridge:
@@ -417,9 +387,11 @@ class TestEventManagerUpdateToEventBridge:
 
         result = manager.update_subscriptions_to_event_bridge()
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Successfully updated subscriptions to EventBridge'
-        assert result['data']['result'] == 'migration-completed'
+        assert_ok(
+            result,
+            message='Successfully updated subscriptions to EventBridge',
+            result='migration-completed',
+        )
 
     def test_update_subscriptions_to_event_bridge_force_move(self, manager, mock_client):
         """Test update to EventBridge with force move."""
@@ -427,7 +399,7 @@ class TestEventManagerUpdateToEventBridge:
 
         result = manager.update_subscriptions_to_event_bridge(force_move=True)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['ForceMove'] is True
 
@@ -437,7 +409,7 @@ class TestEventManagerUpdateToEventBridge:
 
         result = manager.update_subscriptions_to_event_bridge(force_move=False)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert 'ForceMove' not in call_args
 
@@ -459,38 +431,30 @@ class TestEventManagerErrorHandling:
         """Test API error during subscription creation."""
         mock_client.call_api.side_effect = Exception('API Error')
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match='API Error'):
             manager.create_event_subscription('test-sub', 'arn:topic')
 
-        assert 'API Error' in str(exc_info.value)
-
     def test_modify_subscription_api_error(self, manager, mock_client):
         """Test API error during subscription modification."""
         mock_client.call_api.side_effect = Exception('Network error')
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match='Network error'):
             manager.modify_event_subscription('test-sub')
 
-        assert 'Network error' in str(exc_info.value)
-
     def test_delete_subscription_api_error(self, manager, mock_client):
         """Test API error during subscription deletion."""
         mock_client.call_api.side_effect = Exception('Service error')
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match='Service error'):
             manager.delete_event_subscription('test-sub')
 
-        assert 'Service error' in str(exc_info.value)
-
     def test_list_events_api_error(self, manager, mock_client):
         """Test API error during events listing."""
         mock_client.call_api.side_effect = Exception('Timeout error')
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match='Timeout error'):
             manager.list_events()
 
-        assert 'Timeout error' in str(exc_info.value)
-
 
 class TestEventManagerEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -511,7 +475,7 @@ class TestEventManagerEdgeCases:
 
         result = manager.list_event_subscriptions(max_results=1000)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['MaxRecords'] == 1000
 
@@ -521,7 +485,7 @@ class TestEventManagerEdgeCases:
 
         result = manager.list_events(max_results=1000)
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
         assert call_args['MaxRecords'] == 1000
 
@@ -529,26 +493,26 @@ class TestEventManagerEdgeCases:
         """Test subscription creation with multiple source IDs."""
         mock_client.call_api.return_value = {'EventSubscription': {}}
 
-        source_ids = ['id-1', 'id-2', 'id-3', 'id-4', 'id-5']
-        result = manager.create_event_subscription('test-sub', 'arn:topic', source_ids=source_ids)
+        result = manager.create_event_subscription(
+            'test-sub', 'arn:topic', source_ids=list(_MANY_SOURCE_IDS)
+        )
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
-        assert call_args['SourceIds'] == source_ids
+        assert call_args['SourceIds'] == list(_MANY_SOURCE_IDS)
         assert len(call_args['SourceIds']) == 5
 
     def test_create_subscription_with_multiple_event_categories(self, manager, mock_client):
         """Test subscription creation with multiple event categories."""
         mock_client.call_api.return_value = {'EventSubscription': {}}
 
-        categories = ['failure', 'creation', 'deletion', 'configuration change']
         result = manager.create_event_subscription(
-            'test-sub', 'arn:topic', event_categories=categories
+            'test-sub', 'arn:topic', event_categories=list(_MANY_EVENT_CATEGORIES)
         )
 
-        assert result['success'] is True
+        assert_ok(result)
         call_args = mock_client.call_api.call_args[1]
-        assert call_args['EventCategories'] == categories
+        assert call_args['EventCategories'] == list(_MANY_EVENT_CATEGORIES)
 
     def test_list_events_empty_filters(self, manager, mock_client):
         """Test events listing with empty filters list."""
@@ -556,7 +520,7 @@ class TestEventManagerEdgeCases:
 
         result = manager.list_events(filters=[])
 
-        assert result['success'] is True
+        assert_ok(result)
         # Empty filters list is not passed to API (falsy value)
         call_args = mock_client.call_api.call_args[1]
         assert 'Filters' not in call_args
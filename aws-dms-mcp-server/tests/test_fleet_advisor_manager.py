@@ -16,30 +16,61 @@
 
 import pytest
 from awslabs.aws_dms_mcp_server.utils.fleet_advisor_manager import FleetAdvisorManager
-from unittest.mock import Mock
 
 
-class TestFleetAdvisorManagerCollectorOperations:
-    """Test Fleet Advisor collector operations."""
+LIST_OPS = [
+    ('list_collectors', 'Collectors', 'collectors'),
+    ('list_databases', 'Databases', 'databases'),
+    ('list_schemas', 'FleetAdvisorSchemas', 'schemas'),
+    ('describe_schema_object_summary', 'FleetAdvisorSchemaObjects', 'schema_objects'),
+    ('describe_lsa_analysis', 'Analysis', 'lsa_analysis'),
+]
+LIST_OP_IDS = [op[0] for op in LIST_OPS]
+
+FILTERED_LIST_OPS = [
+    ('list_collectors', 'Collectors', [{'Name': 'collector-name', 'Values': ['test-collector']}]),
+    ('list_databases', 'Databases', [{'Name': 'database-engine', 'Values': ['mysql']}]),
+    ('list_schemas', 'FleetAdvisorSchemas', [{'Name': 'schema-name', 'Values': ['public']}]),
+    (
+        'describe_schema_object_summary',
+        'FleetAdvisorSchemaObjects',
+        [{'Name': 'object-type', 'Values': ['TABLE']}],
+    ),
+]
+FILTERED_LIST_OP_IDS = [op[0] for op in FILTERED_LIST_OPS]
+
+# Canned call_api responses; the manager only reads them, so tests share one copy.
+_COLLECTOR_RESPONSE = {
+    'Collector': {
+        'CollectorReferencedId': 'collector-123',
+        'CollectorName': 'test-collector',
+    }
+}
+_DATABASE_IDS_RESPONSE = {'DatabaseIds': ['db-1', 'db-2']}
+_LSA_ANALYSIS_RUN_RESPONSE = {
+    'LSAAnalysisRun': {'AnalysisId': 'analysis-123', 'Status': 'running'}
+}
+_LIST_ITEMS = [{'Id': 'item-1'}, {'Id': 'item-2'}]
+_SCHEMAS_FIRST_PAGE = {
+    'FleetAdvisorSchemas': [{'SchemaId': 'schema-1'}],
+    'NextToken': 'token-1',
+}
+# No NextToken means last page
+_SCHEMAS_LAST_PAGE = {'FleetAdvisorSchemas': [{'SchemaId': 'schema-2'}]}
+
+
+@pytest.fixture(scope='module')
+def manager(manager_factory, _shared_fake_client):
+    """Create FleetAdvisorManager instance shared by every test in the module."""
+    return manager_factory(FleetAdvisorManager, _shared_fake_client)
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
 
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
+class TestFleetAdvisorManagerCollectorOperations:
+    """Test Fleet Advisor collector operations."""
 
-    def test_create_collector_success(self, manager, mock_client):
+    def test_create_collector_success(self, manager, fake_client):
         """Test successful collector creation."""
-        mock_client.call_api.return_value = {
-            'Collector': {
-                'CollectorReferencedId': 'collector-123',
-                'CollectorName': 'test-collector',
-            }
-        }
+        fake_client.return_value = _COLLECTOR_RESPONSE
 
         result = manager.create_collector(
             name='test-collector',
@@ -51,455 +82,197 @@ class TestFleetAdvisorManagerCollectorOperations:
         assert result['success'] is True
         assert result['data']['message'] == 'Fleet Advisor collector created'
         assert 'collector' in result['data']
-        mock_client.call_api.assert_called_once_with(
-            'create_fleet_advisor_collector',
-            CollectorName='test-collector',
-            Description='Test collector',
-            ServiceAccessRoleArn='arn:aws:iam::123:role/test',
-            S3BucketName='test-bucket',
-        )
+        assert fake_client.call_count == 1
+        assert fake_client.last_args == ('create_fleet_advisor_collector',)
+        assert fake_client.last_kwargs == {
+            'CollectorName': 'test-collector',
+            'Description': 'Test collector',
+            'ServiceAccessRoleArn': 'arn:aws:iam::123:role/test',
+            'S3BucketName': 'test-bucket',
+        }
 
-    def test_delete_collector_success(self, manager, mock_client):
+    def test_delete_collector_success(self, manager, fake_client):
         """Test successful collector deletion."""
-        mock_client.call_api.return_value = {}
+        fake_client.return_value = {}
 
         result = manager.delete_collector('collector-123')
 
         assert result['success'] is True
         assert result['data']['message'] == 'Fleet Advisor collector deleted'
-        mock_client.call_api.assert_called_once_with(
-            'delete_fleet_advisor_collector', CollectorReferencedId='collector-123'
-        )
-
-    def test_list_collectors_success(self, manager, mock_client):
-        """Test successful collector listing."""
-        mock_client.call_api.return_value = {
-            'Collectors': [
-                {'CollectorReferencedId': 'collector-1', 'CollectorName': 'collector-1'},
-                {'CollectorReferencedId': 'collector-2', 'CollectorName': 'collector-2'},
-            ]
-        }
-
-        result = manager.list_collectors()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert 'collectors' in result['data']
-
-    def test_list_collectors_with_filters(self, manager, mock_client):
-        """Test listing collectors with filters."""
-        mock_client.call_api.return_value = {'Collectors': []}
-
-        filters = [{'Name': 'collector-name', 'Values': ['test-collector']}]
-        result = manager.list_collectors(filters=filters, max_results=50, marker='token')
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 50
-        assert call_args['NextToken'] == 'token'
-
-    def test_list_collectors_with_pagination(self, manager, mock_client):
-        """Test listing collectors with pagination."""
-        mock_client.call_api.return_value = {'Collectors': [], 'NextToken': 'next-token'}
-
-        result = manager.list_collectors()
-
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-        assert result['data']['next_token'] == 'next-token'
-
-    def test_list_collectors_empty(self, manager, mock_client):
-        """Test listing collectors with empty result."""
-        mock_client.call_api.return_value = {'Collectors': []}
-
-        result = manager.list_collectors()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['collectors'] == []
+        assert fake_client.call_count == 1
+        assert fake_client.last_args == ('delete_fleet_advisor_collector',)
+        assert fake_client.last_kwargs == {'CollectorReferencedId': 'collector-123'}
 
 
 class TestFleetAdvisorManagerDatabaseOperations:
     """Test Fleet Advisor database operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
-
-    def test_delete_databases_success(self, manager, mock_client):
+    def test_delete_databases_success(self, manager, fake_client):
         """Test successful database deletion."""
-        mock_client.call_api.return_value = {'DatabaseIds': ['db-1', 'db-2']}
+        fake_client.return_value = _DATABASE_IDS_RESPONSE
 
         result = manager.delete_databases(['db-1', 'db-2'])
 
         assert result['success'] is True
         assert result['data']['message'] == 'Fleet Advisor databases deleted'
         assert result['data']['database_ids'] == ['db-1', 'db-2']
-        mock_client.call_api.assert_called_once_with(
-            'delete_fleet_advisor_databases', DatabaseIds=['db-1', 'db-2']
-        )
+        assert fake_client.call_count == 1
+        assert fake_client.last_args == ('delete_fleet_advisor_databases',)
+        assert fake_client.last_kwargs == {'DatabaseIds': ['db-1', 'db-2']}
 
-    def test_delete_databases_single(self, manager, mock_client):
+    def test_delete_databases_single(self, manager, fake_client):
         """Test deleting single database."""
-        mock_client.call_api.return_value = {'DatabaseIds': ['db-1']}
+        fake_client.return_value = {'DatabaseIds': ['db-1']}
 
         result = manager.delete_databases(['db-1'])
 
         assert result['success'] is True
         assert len(result['data']['database_ids']) == 1
 
-    def test_list_databases_success(self, manager, mock_client):
-        """Test successful database listing."""
-        mock_client.call_api.return_value = {
-            'Databases': [
-                {'DatabaseId': 'db-1', 'DatabaseName': 'database-1'},
-                {'DatabaseId': 'db-2', 'DatabaseName': 'database-2'},
-                {'DatabaseId': 'db-3', 'DatabaseName': 'database-3'},
-            ]
-        }
-
-        result = manager.list_databases()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 3
-        assert 'databases' in result['data']
-
-    def test_list_databases_with_filters(self, manager, mock_client):
-        """Test listing databases with filters."""
-        mock_client.call_api.return_value = {'Databases': []}
-
-        filters = [{'Name': 'database-engine', 'Values': ['mysql']}]
-        result = manager.list_databases(filters=filters, max_results=50, marker='token')
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 50
-        assert call_args['NextToken'] == 'token'
-
-    def test_list_databases_with_pagination(self, manager, mock_client):
-        """Test listing databases with pagination."""
-        mock_client.call_api.return_value = {'Databases': [], 'NextToken': 'next-token'}
-
-        result = manager.list_databases()
-
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-        assert result['data']['next_token'] == 'next-token'
-
-    def test_list_databases_empty(self, manager, mock_client):
-        """Test listing databases with empty result."""
-        mock_client.call_api.return_value = {'Databases': []}
-
-        result = manager.list_databases()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['databases'] == []
-
 
 class TestFleetAdvisorManagerLSAAnalysis:
     """Test Fleet Advisor LSA analysis operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
-
-    def test_describe_lsa_analysis_success(self, manager, mock_client):
-        """Test successful LSA analysis description."""
-        mock_client.call_api.return_value = {
-            'Analysis': [
-                {'AnalysisId': 'analysis-1', 'Status': 'completed'},
-                {'AnalysisId': 'analysis-2', 'Status': 'completed'},
-            ]
-        }
-
-        result = manager.describe_lsa_analysis()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert 'lsa_analysis' in result['data']
-
-    def test_describe_lsa_analysis_with_pagination(self, manager, mock_client):
-        """Test LSA analysis with pagination."""
-        mock_client.call_api.return_value = {'Analysis': [], 'NextToken': 'next-token'}
-
-        result = manager.describe_lsa_analysis(max_results=50, marker='token')
-
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['MaxRecords'] == 50
-        assert call_args['NextToken'] == 'token'
-
-    def test_describe_lsa_analysis_empty(self, manager, mock_client):
-        """Test LSA analysis with empty result."""
-        mock_client.call_api.return_value = {'Analysis': []}
-
-        result = manager.describe_lsa_analysis()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-
-    def test_run_lsa_analysis_success(self, manager, mock_client):
+    def test_run_lsa_analysis_success(self, manager, fake_client):
         """Test successful LSA analysis run."""
-        mock_client.call_api.return_value = {
-            'LSAAnalysisRun': {'AnalysisId': 'analysis-123', 'Status': 'running'}
-        }
+        fake_client.return_value = _LSA_ANALYSIS_RUN_RESPONSE
 
         result = manager.run_lsa_analysis()
 
         assert result['success'] is True
         assert result['data']['message'] == 'Fleet Advisor LSA analysis started'
         assert 'lsa_analysis_run' in result['data']
-        mock_client.call_api.assert_called_once_with('run_fleet_advisor_lsa_analysis')
-
-
-class TestFleetAdvisorManagerSchemaOperations:
-    """Test Fleet Advisor schema operations."""
+        assert fake_client.call_count == 1
+        assert fake_client.last_args == ('run_fleet_advisor_lsa_analysis',)
+        assert fake_client.last_kwargs == {}
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
 
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
+class TestFleetAdvisorManagerListOperations:
+    """Test Fleet Advisor list and describe operations."""
 
-    def test_describe_schema_object_summary_success(self, manager, mock_client):
-        """Test successful schema object summary description."""
-        mock_client.call_api.return_value = {
-            'FleetAdvisorSchemaObjects': [
-                {'ObjectType': 'TABLE', 'NumberOfObjects': 10},
-                {'ObjectType': 'VIEW', 'NumberOfObjects': 5},
-            ]
-        }
+    @pytest.mark.parametrize('method,resp_key,data_key', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_success(self, manager, fake_client, method, resp_key, data_key):
+        """Test successful listing."""
+        fake_client.return_value = {resp_key: _LIST_ITEMS}
 
-        result = manager.describe_schema_object_summary()
+        result = getattr(manager, method)()
 
         assert result['success'] is True
         assert result['data']['count'] == 2
-        assert 'schema_objects' in result['data']
+        assert result['data'][data_key] == _LIST_ITEMS
+        assert 'next_token' not in result['data']
 
-    def test_describe_schema_object_summary_with_filters(self, manager, mock_client):
-        """Test schema object summary with filters."""
-        mock_client.call_api.return_value = {'FleetAdvisorSchemaObjects': []}
+    @pytest.mark.parametrize(
+        'method,resp_key,filters', FILTERED_LIST_OPS, ids=FILTERED_LIST_OP_IDS
+    )
+    def test_list_with_filters(self, manager, fake_client, method, resp_key, filters):
+        """Test listing with filters."""
+        fake_client.return_value = {resp_key: []}
 
-        filters = [{'Name': 'object-type', 'Values': ['TABLE']}]
-        result = manager.describe_schema_object_summary(
-            filters=filters, max_results=50, marker='token'
-        )
+        result = getattr(manager, method)(filters=filters, max_results=50, marker='token')
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['Filters'] == filters
         assert call_args['MaxRecords'] == 50
         assert call_args['NextToken'] == 'token'
 
-    def test_describe_schema_object_summary_with_pagination(self, manager, mock_client):
-        """Test schema object summary with pagination."""
-        mock_client.call_api.return_value = {
-            'FleetAdvisorSchemaObjects': [],
-            'NextToken': 'next-token',
-        }
+    @pytest.mark.parametrize('method,resp_key,data_key', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_with_pagination(self, manager, fake_client, method, resp_key, data_key):
+        """Test listing with pagination."""
+        fake_client.return_value = {resp_key: [], 'NextToken': 'next-token'}
 
-        result = manager.describe_schema_object_summary()
+        result = getattr(manager, method)(max_results=50, marker='token')
 
         assert result['success'] is True
-        assert 'next_token' in result['data']
-
-    def test_list_schemas_success(self, manager, mock_client):
-        """Test successful schema listing."""
-        mock_client.call_api.return_value = {
-            'FleetAdvisorSchemas': [
-                {'SchemaId': 'schema-1', 'SchemaName': 'public'},
-                {'SchemaId': 'schema-2', 'SchemaName': 'information_schema'},
-            ]
-        }
-
-        result = manager.list_schemas()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert 'schemas' in result['data']
-
-    def test_list_schemas_with_filters(self, manager, mock_client):
-        """Test listing schemas with filters."""
-        mock_client.call_api.return_value = {'FleetAdvisorSchemas': []}
-
-        filters = [{'Name': 'schema-name', 'Values': ['public']}]
-        result = manager.list_schemas(filters=filters, max_results=50, marker='token')
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
+        assert result['data']['next_token'] == 'next-token'
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 50
         assert call_args['NextToken'] == 'token'
 
-    def test_list_schemas_with_pagination(self, manager, mock_client):
-        """Test listing schemas with pagination."""
-        mock_client.call_api.return_value = {'FleetAdvisorSchemas': [], 'NextToken': 'next-token'}
-
-        result = manager.list_schemas()
+    @pytest.mark.parametrize('method,resp_key,data_key', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_empty(self, manager, fake_client, method, resp_key, data_key):
+        """Test listing with empty result."""
+        fake_client.return_value = {resp_key: []}
 
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-
-    def test_list_schemas_empty(self, manager, mock_client):
-        """Test listing schemas with empty result."""
-        mock_client.call_api.return_value = {'FleetAdvisorSchemas': []}
-
-        result = manager.list_schemas()
+        result = getattr(manager, method)()
 
         assert result['success'] is True
         assert result['data']['count'] == 0
+        assert result['data'][data_key] == []
 
 
 class TestFleetAdvisorManagerErrorHandling:
     """Test error handling."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
-
-    def test_create_collector_api_error(self, manager, mock_client):
-        """Test API error during collector creation."""
-        mock_client.call_api.side_effect = Exception('API Error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.create_collector('test', 'desc', 'arn', 'bucket')
-
-        assert 'API Error' in str(exc_info.value)
-
-    def test_delete_collector_api_error(self, manager, mock_client):
-        """Test API error during collector deletion."""
-        mock_client.call_api.side_effect = Exception('Delete failed')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.delete_collector('collector-123')
-
-        assert 'Delete failed' in str(exc_info.value)
-
-    def test_list_collectors_api_error(self, manager, mock_client):
-        """Test API error during collector listing."""
-        mock_client.call_api.side_effect = Exception('Network error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.list_collectors()
-
-        assert 'Network error' in str(exc_info.value)
-
-    def test_delete_databases_api_error(self, manager, mock_client):
-        """Test API error during database deletion."""
-        mock_client.call_api.side_effect = Exception('Delete error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.delete_databases(['db-1'])
-
-        assert 'Delete error' in str(exc_info.value)
-
-    def test_list_databases_api_error(self, manager, mock_client):
-        """Test API error during database listing."""
-        mock_client.call_api.side_effect = Exception('List error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.list_databases()
-
-        assert 'List error' in str(exc_info.value)
-
-    def test_run_lsa_analysis_api_error(self, manager, mock_client):
-        """Test API error during LSA analysis run."""
-        mock_client.call_api.side_effect = Exception('Analysis error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.run_lsa_analysis()
-
-        assert 'Analysis error' in str(exc_info.value)
+    @pytest.mark.parametrize(
+        'method,args,msg',
+        [
+            ('create_collector', ('test', 'desc', 'arn', 'bucket'), 'API Error'),
+            ('delete_collector', ('collector-123',), 'Delete failed'),
+            ('list_collectors', (), 'Network error'),
+            ('delete_databases', (['db-1'],), 'Delete error'),
+            ('list_databases', (), 'List error'),
+            ('run_lsa_analysis', (), 'Analysis error'),
+        ],
+    )
+    def test_api_error(self, manager, fake_client, method, args, msg):
+        """Test API errors propagate from each manager operation."""
+        fake_client.side_effect = Exception(msg)
+
+        with pytest.raises(Exception, match=msg):
+            getattr(manager, method)(*args)
 
 
 class TestFleetAdvisorManagerEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create FleetAdvisorManager instance."""
-        return FleetAdvisorManager(mock_client)
-
-    def test_delete_databases_empty_list(self, manager, mock_client):
+    def test_delete_databases_empty_list(self, manager, fake_client):
         """Test deleting databases with empty list."""
-        mock_client.call_api.return_value = {'DatabaseIds': []}
+        fake_client.return_value = {'DatabaseIds': []}
 
         result = manager.delete_databases([])
 
         assert result['success'] is True
         assert result['data']['database_ids'] == []
 
-    def test_list_operations_with_max_results_boundary(self, manager, mock_client):
+    def test_list_operations_with_max_results_boundary(self, manager, fake_client):
         """Test list operations with maximum results."""
-        mock_client.call_api.return_value = {'Collectors': []}
+        fake_client.return_value = {'Collectors': []}
 
         result = manager.list_collectors(max_results=1000)
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 1000
 
-    def test_list_collectors_without_optional_params(self, manager, mock_client):
+    def test_list_collectors_without_optional_params(self, manager, fake_client):
         """Test listing collectors without optional parameters."""
-        mock_client.call_api.return_value = {'Collectors': []}
+        fake_client.return_value = {'Collectors': []}
 
         result = manager.list_collectors()
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 100
         assert 'Filters' not in call_args
         assert 'NextToken' not in call_args
 
-    def test_describe_lsa_analysis_without_optional_params(self, manager, mock_client):
+    def test_describe_lsa_analysis_without_optional_params(self, manager, fake_client):
         """Test describing LSA analysis without optional parameters."""
-        mock_client.call_api.return_value = {'Analysis': []}
+        fake_client.return_value = {'Analysis': []}
 
         result = manager.describe_lsa_analysis()
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 100
         assert 'NextToken' not in call_args
 
-    def test_list_schemas_multiple_pages(self, manager, mock_client):
+    def test_list_schemas_multiple_pages(self, manager, fake_client):
         """Test listing schemas across multiple pages."""
         # First call returns data with token
-        mock_client.call_api.return_value = {
-            'FleetAdvisorSchemas': [{'SchemaId': 'schema-1'}],
-            'NextToken': 'token-1',
-        }
+        fake_client.return_value = _SCHEMAS_FIRST_PAGE
 
         result1 = manager.list_schemas()
 
@@ -508,10 +281,7 @@ class TestFleetAdvisorManagerEdgeCases:
         assert result1['data']['next_token'] == 'token-1'
 
         # Second call with token
-        mock_client.call_api.return_value = {
-            'FleetAdvisorSchemas': [{'SchemaId': 'schema-2'}]
-            # No NextToken means last page
-        }
+        fake_client.return_value = _SCHEMAS_LAST_PAGE
 
         result2 = manager.list_schemas(marker='token-1')
 
@@ -519,9 +289,9 @@ class TestFleetAdvisorManagerEdgeCases:
         assert result2['data']['count'] == 1
         assert 'next_token' not in result2['data']
 
-    def test_create_collector_with_all_params(self, manager, mock_client):
+    def test_create_collector_with_all_params(self, manager, fake_client):
         """Test creating collector with all parameters."""
-        mock_client.call_api.return_value = {'Collector': {'CollectorReferencedId': 'col-123'}}
+        fake_client.return_value = _COLLECTOR_RESPONSE
 
         result = manager.create_collector(
             name='detailed-collector',
@@ -531,7 +301,7 @@ class TestFleetAdvisorManagerEdgeCases:
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['CollectorName'] == 'detailed-collector'
         assert 'detailed test collector' in call_args['Description'].lower()
         assert call_args['ServiceAccessRoleArn'].startswith('arn:aws:iam::')
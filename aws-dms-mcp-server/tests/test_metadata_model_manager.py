@@ -16,608 +16,409 @@
 
 import pytest
 from awslabs.aws_dms_mcp_server.utils.metadata_model_manager import MetadataModelManager
-from unittest.mock import Mock
+from tests.utils import assert_called_once_kw
+
+
+pytestmark = pytest.mark.xdist_group('metadata_model_manager')
+
+SELECTION_RULES = '{"rules": []}'
+# Kept as tuples; call sites pass list(...) copies since the manager parameters are List-typed.
+FILTERS_STATUS_ACTIVE = ({'Name': 'status', 'Values': ['active']},)
+REPORT_TYPES = ('summary', 'detailed')
+REPORT_TYPES_SUMMARY = ('summary',)
+
+_TWO_ITEMS = [{'Id': '1'}, {'Id': '2'}]
+_CONV_CFG = {'option': 'value'}
+_NEW_CONV_CFG = {'option': 'new_value'}
+
+DESCRIBE_CASES = [
+    (
+        'describe_extension_pack_associations',
+        'ExtensionPackAssociations',
+        'extension_pack_associations',
+    ),
+    (
+        'describe_metadata_model_assessments',
+        'MetadataModelAssessments',
+        'metadata_model_assessments',
+    ),
+    (
+        'describe_metadata_model_conversions',
+        'MetadataModelConversions',
+        'metadata_model_conversions',
+    ),
+    (
+        'describe_metadata_model_exports_as_script',
+        'MetadataModelExportsAsScript',
+        'metadata_model_exports',
+    ),
+    (
+        'describe_metadata_model_exports_to_target',
+        'MetadataModelExportsToTarget',
+        'metadata_model_exports',
+    ),
+    ('describe_metadata_model_imports', 'MetadataModelImports', 'metadata_model_imports'),
+]
+
+ERROR_CASES = [
+    ('describe_conversion_configuration', ('arn:test',), 'API Error'),
+    ('start_metadata_model_assessment', ('arn:test', '{}'), 'Network error'),
+    ('start_metadata_model_conversion', ('arn:test', '{}'), 'Service error'),
+]
+
+
+@pytest.fixture(scope='module')
+def manager(manager_factory, _shared_fake_client):
+    """Create MetadataModelManager around the session-wide fake client."""
+    return manager_factory(MetadataModelManager, _shared_fake_client)
+
+
+@pytest.fixture(scope='class')
+def bound(request, manager):
+    """Resolve the manager method named by an indirect parameter once per class."""
+    return getattr(manager, request.param)
+
+
+@pytest.mark.parametrize(
+    'bound,resp_key,data_key',
+    DESCRIBE_CASES,
+    ids=[c[0] for c in DESCRIBE_CASES],
+    indirect=['bound'],
+    scope='class',
+)
+@pytest.mark.category(name='describe')
+class TestMetadataModelManagerDescribeOperations:
+    """Test the paginated describe operations shared by every category."""
+
+    @pytest.mark.benchmark
+    def test_describe_success(self, bound, fake_client, resp_key, data_key):
+        """Test each describe operation returns the listed items and their count."""
+        fake_client.return_value = {resp_key: _TWO_ITEMS}
+
+        result = bound('arn:test')
 
+        assert result['success'] is True
+        assert result['data']['count'] == 2
+        assert len(result['data'][data_key]) == 2
+        assert fake_client.last_op == bound.__name__
+        assert fake_client.last_kwargs == {'MigrationProjectArn': 'arn:test', 'MaxRecords': 100}
 
-class TestMetadataModelManagerConversionConfiguration:
-    """Test conversion configuration operations."""
+    def test_describe_empty(self, bound, fake_client, resp_key, data_key):
+        """Test each describe operation with an empty result."""
+        fake_client.return_value = {resp_key: []}
+
+        result = bound('arn:test')
+
+        assert result['success'] is True
+        assert result['data']['count'] == 0
+        assert result['data'][data_key] == []
+        assert 'next_marker' not in result['data']
+
+    def test_describe_with_params(self, bound, fake_client, resp_key, data_key):
+        """Test each describe operation forwards filters, marker and page size."""
+        fake_client.return_value = {resp_key: []}
+
+        result = bound(
+            'arn:test', filters=list(FILTERS_STATUS_ACTIVE), marker='token', max_results=50
+        )
+
+        assert result['success'] is True
+        assert_called_once_kw(
+            fake_client,
+            bound.__name__,
+            MigrationProjectArn='arn:test',
+            MaxRecords=50,
+            Filters=list(FILTERS_STATUS_ACTIVE),
+            Marker='token',
+        )
+
+    def test_describe_with_pagination(self, bound, fake_client, resp_key, data_key):
+        """Test each describe operation surfaces the next page marker."""
+        fake_client.return_value = {resp_key: [], 'Marker': 'next-token'}
+
+        result = bound('arn:test')
+
+        assert result['success'] is True
+        assert result['data']['next_marker'] == 'next-token'
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
 
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
+@pytest.mark.category(name='conversion_configuration')
+class TestMetadataModelManagerConversionConfiguration:
+    """Test conversion configuration operations."""
 
-    def test_describe_conversion_configuration_success(self, manager, mock_client):
+    @pytest.mark.benchmark
+    def test_describe_conversion_configuration_success(self, manager, fake_client):
         """Test successful conversion configuration retrieval."""
-        mock_client.call_api.return_value = {'ConversionConfiguration': {'option': 'value'}}
+        fake_client.return_value = {'ConversionConfiguration': _CONV_CFG}
 
         result = manager.describe_conversion_configuration('arn:test')
 
         assert result['success'] is True
-        assert 'conversion_configuration' in result['data']
-        mock_client.call_api.assert_called_once_with(
-            'describe_conversion_configuration', MigrationProjectArn='arn:test'
-        )
+        assert result['data']['conversion_configuration'] == _CONV_CFG
+        assert fake_client.last_op == 'describe_conversion_configuration'
+        assert fake_client.last_kwargs == {'MigrationProjectArn': 'arn:test'}
 
-    def test_describe_conversion_configuration_empty(self, manager, mock_client):
+    def test_describe_conversion_configuration_empty(self, manager, fake_client):
         """Test conversion configuration retrieval with empty response."""
-        mock_client.call_api.return_value = {}
+        fake_client.return_value = {}
 
         result = manager.describe_conversion_configuration('arn:test')
 
         assert result['success'] is True
         assert result['data']['conversion_configuration'] == {}
 
-    def test_modify_conversion_configuration_success(self, manager, mock_client):
+    def test_modify_conversion_configuration_success(self, manager, fake_client):
         """Test successful conversion configuration modification."""
-        mock_client.call_api.return_value = {'ConversionConfiguration': {'option': 'new_value'}}
+        fake_client.return_value = {'ConversionConfiguration': _NEW_CONV_CFG}
 
-        config = {'option': 'new_value'}
-        result = manager.modify_conversion_configuration('arn:test', config)
+        result = manager.modify_conversion_configuration('arn:test', _NEW_CONV_CFG)
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Conversion configuration modified'
-        mock_client.call_api.assert_called_once_with(
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Conversion configuration modified'
+        )
+        assert_called_once_kw(
+            fake_client,
             'modify_conversion_configuration',
             MigrationProjectArn='arn:test',
-            ConversionConfiguration=config,
+            ConversionConfiguration=_NEW_CONV_CFG,
         )
 
 
+@pytest.mark.category(name='extension_pack')
 class TestMetadataModelManagerExtensionPack:
     """Test extension pack operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_extension_pack_associations_success(self, manager, mock_client):
-        """Test successful extension pack associations listing."""
-        mock_client.call_api.return_value = {
-            'ExtensionPackAssociations': [
-                {'AssociationId': 'assoc-1'},
-                {'AssociationId': 'assoc-2'},
-            ]
-        }
-
-        result = manager.describe_extension_pack_associations('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['extension_pack_associations']) == 2
-
-    def test_describe_extension_pack_associations_with_filters(self, manager, mock_client):
-        """Test extension pack associations listing with filters."""
-        mock_client.call_api.return_value = {'ExtensionPackAssociations': []}
-
-        filters = [{'Name': 'status', 'Values': ['active']}]
-        result = manager.describe_extension_pack_associations(
-            'arn:test', filters=filters, marker='token', max_results=50
-        )
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['Marker'] == 'token'
-        assert call_args['MaxRecords'] == 50
-
-    def test_describe_extension_pack_associations_with_pagination(self, manager, mock_client):
-        """Test extension pack associations with pagination."""
-        mock_client.call_api.return_value = {
-            'ExtensionPackAssociations': [],
-            'Marker': 'next-token',
-        }
-
-        result = manager.describe_extension_pack_associations('arn:test')
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-        assert result['data']['next_marker'] == 'next-token'
-
-    def test_start_extension_pack_association_success(self, manager, mock_client):
+    def test_start_extension_pack_association_success(self, manager, fake_client):
         """Test successful extension pack association start."""
-        mock_client.call_api.return_value = {
-            'ExtensionPackAssociation': {'AssociationId': 'assoc-1'}
-        }
+        fake_client.return_value = {'ExtensionPackAssociation': {'AssociationId': 'assoc-1'}}
 
         result = manager.start_extension_pack_association('arn:test')
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Extension pack association started'
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Extension pack association started'
+        )
         assert 'extension_pack_association' in result['data']
 
 
+@pytest.mark.category(name='assessments')
 class TestMetadataModelManagerAssessments:
     """Test metadata model assessment operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_metadata_model_assessments_success(self, manager, mock_client):
-        """Test successful assessments listing."""
-        mock_client.call_api.return_value = {
-            'MetadataModelAssessments': [
-                {'AssessmentId': 'assessment-1'},
-                {'AssessmentId': 'assessment-2'},
-            ]
-        }
-
-        result = manager.describe_metadata_model_assessments('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['metadata_model_assessments']) == 2
-
-    def test_describe_metadata_model_assessments_with_params(self, manager, mock_client):
-        """Test assessments listing with all parameters."""
-        mock_client.call_api.return_value = {
-            'MetadataModelAssessments': [],
-            'Marker': 'next-token',
-        }
-
-        filters = [{'Name': 'status', 'Values': ['completed']}]
-        result = manager.describe_metadata_model_assessments(
-            'arn:test', filters=filters, marker='token', max_results=25
-        )
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-
-    def test_start_metadata_model_assessment_success(self, manager, mock_client):
+    @pytest.mark.benchmark
+    def test_start_metadata_model_assessment_success(self, manager, fake_client):
         """Test successful assessment start."""
-        mock_client.call_api.return_value = {
-            'MetadataModelAssessment': {'AssessmentId': 'assessment-1'}
-        }
+        fake_client.return_value = {'MetadataModelAssessment': {'AssessmentId': 'assessment-1'}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.start_metadata_model_assessment('arn:test', selection_rules)
+        result = manager.start_metadata_model_assessment('arn:test', SELECTION_RULES)
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model assessment started'
-        mock_client.call_api.assert_called_once_with(
-            'start_metadata_model_assessment',
-            MigrationProjectArn='arn:test',
-            SelectionRules=selection_rules,
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model assessment started'
         )
+        assert fake_client.last_op == 'start_metadata_model_assessment'
+        assert fake_client.last_kwargs == {
+            'MigrationProjectArn': 'arn:test',
+            'SelectionRules': SELECTION_RULES,
+        }
 
 
+@pytest.mark.category(name='conversions')
 class TestMetadataModelManagerConversions:
     """Test metadata model conversion operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_metadata_model_conversions_success(self, manager, mock_client):
-        """Test successful conversions listing."""
-        mock_client.call_api.return_value = {
-            'MetadataModelConversions': [
-                {'ConversionId': 'conv-1'},
-                {'ConversionId': 'conv-2'},
-            ]
-        }
-
-        result = manager.describe_metadata_model_conversions('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['metadata_model_conversions']) == 2
-
-    def test_describe_metadata_model_conversions_empty(self, manager, mock_client):
-        """Test conversions listing with empty result."""
-        mock_client.call_api.return_value = {'MetadataModelConversions': []}
-
-        result = manager.describe_metadata_model_conversions('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-
-    def test_describe_metadata_model_conversions_with_pagination(self, manager, mock_client):
-        """Test conversions listing with pagination."""
-        mock_client.call_api.return_value = {
-            'MetadataModelConversions': [],
-            'Marker': 'next-token',
-        }
-
-        result = manager.describe_metadata_model_conversions('arn:test', marker='token')
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-
-    def test_start_metadata_model_conversion_success(self, manager, mock_client):
+    def test_start_metadata_model_conversion_success(self, manager, fake_client):
         """Test successful conversion start."""
-        mock_client.call_api.return_value = {'MetadataModelConversion': {'ConversionId': 'conv-1'}}
+        fake_client.return_value = {'MetadataModelConversion': {'ConversionId': 'conv-1'}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.start_metadata_model_conversion('arn:test', selection_rules)
+        result = manager.start_metadata_model_conversion('arn:test', SELECTION_RULES)
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model conversion started'
-        mock_client.call_api.assert_called_once_with(
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model conversion started'
+        )
+        assert_called_once_kw(
+            fake_client,
             'start_metadata_model_conversion',
             MigrationProjectArn='arn:test',
-            SelectionRules=selection_rules,
+            SelectionRules=SELECTION_RULES,
         )
 
 
+@pytest.mark.category(name='exports_as_script')
 class TestMetadataModelManagerExportsAsScript:
     """Test metadata model export as script operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_metadata_model_exports_as_script_success(self, manager, mock_client):
-        """Test successful script exports listing."""
-        mock_client.call_api.return_value = {
-            'MetadataModelExportsAsScript': [
-                {'ExportId': 'export-1'},
-                {'ExportId': 'export-2'},
-            ]
-        }
-
-        result = manager.describe_metadata_model_exports_as_script('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['metadata_model_exports']) == 2
-
-    def test_describe_metadata_model_exports_as_script_with_filters(self, manager, mock_client):
-        """Test script exports listing with filters."""
-        mock_client.call_api.return_value = {'MetadataModelExportsAsScript': []}
-
-        filters = [{'Name': 'origin', 'Values': ['source']}]
-        result = manager.describe_metadata_model_exports_as_script(
-            'arn:test', filters=filters, max_results=10
-        )
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 10
-
-    def test_start_metadata_model_export_as_script_success(self, manager, mock_client):
+    def test_start_metadata_model_export_as_script_success(self, manager, fake_client):
         """Test successful script export start."""
-        mock_client.call_api.return_value = {
-            'MetadataModelExportAsScript': {'ExportId': 'export-1'}
-        }
+        fake_client.return_value = {'MetadataModelExportAsScript': {'ExportId': 'export-1'}}
 
-        selection_rules = '{"rules": []}'
         result = manager.start_metadata_model_export_as_script(
-            'arn:test', selection_rules, 'source'
+            'arn:test', SELECTION_RULES, 'source'
         )
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model export as script started'
-        mock_client.call_api.assert_called_once()
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model export as script started'
+        )
+        assert fake_client.call_count == 1
 
-    def test_start_metadata_model_export_as_script_with_filename(self, manager, mock_client):
+    def test_start_metadata_model_export_as_script_with_filename(self, manager, fake_client):
         """Test script export start with filename."""
-        mock_client.call_api.return_value = {'MetadataModelExportAsScript': {}}
+        fake_client.return_value = {'MetadataModelExportAsScript': {}}
 
-        selection_rules = '{"rules": []}'
         result = manager.start_metadata_model_export_as_script(
-            'arn:test', selection_rules, 'source', file_name='export.sql'
+            'arn:test', SELECTION_RULES, 'source', file_name='export.sql'
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['FileName'] == 'export.sql'
 
 
+@pytest.mark.category(name='exports_to_target')
 class TestMetadataModelManagerExportsToTarget:
     """Test metadata model export to target operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_metadata_model_exports_to_target_success(self, manager, mock_client):
-        """Test successful target exports listing."""
-        mock_client.call_api.return_value = {
-            'MetadataModelExportsToTarget': [
-                {'ExportId': 'export-1'},
-                {'ExportId': 'export-2'},
-            ]
-        }
-
-        result = manager.describe_metadata_model_exports_to_target('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['metadata_model_exports']) == 2
-
-    def test_describe_metadata_model_exports_to_target_with_pagination(self, manager, mock_client):
-        """Test target exports listing with pagination."""
-        mock_client.call_api.return_value = {
-            'MetadataModelExportsToTarget': [],
-            'Marker': 'next-token',
-        }
-
-        result = manager.describe_metadata_model_exports_to_target('arn:test', marker='token')
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-        assert result['data']['next_marker'] == 'next-token'
-
-    def test_start_metadata_model_export_to_target_success(self, manager, mock_client):
+    def test_start_metadata_model_export_to_target_success(self, manager, fake_client):
         """Test successful target export start."""
-        mock_client.call_api.return_value = {
-            'MetadataModelExportToTarget': {'ExportId': 'export-1'}
-        }
+        fake_client.return_value = {'MetadataModelExportToTarget': {'ExportId': 'export-1'}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.start_metadata_model_export_to_target('arn:test', selection_rules)
+        result = manager.start_metadata_model_export_to_target('arn:test', SELECTION_RULES)
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model export to target started'
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model export to target started'
+        )
 
-    def test_start_metadata_model_export_to_target_with_overwrite(self, manager, mock_client):
+    def test_start_metadata_model_export_to_target_with_overwrite(self, manager, fake_client):
         """Test target export start with overwrite flag."""
-        mock_client.call_api.return_value = {'MetadataModelExportToTarget': {}}
+        fake_client.return_value = {'MetadataModelExportToTarget': {}}
 
-        selection_rules = '{"rules": []}'
         result = manager.start_metadata_model_export_to_target(
-            'arn:test', selection_rules, overwrite_extension_pack=True
+            'arn:test', SELECTION_RULES, overwrite_extension_pack=True
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['OverwriteExtensionPack'] is True
 
 
+@pytest.mark.category(name='imports')
 class TestMetadataModelManagerImports:
     """Test metadata model import operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_metadata_model_imports_success(self, manager, mock_client):
-        """Test successful imports listing."""
-        mock_client.call_api.return_value = {
-            'MetadataModelImports': [{'ImportId': 'import-1'}, {'ImportId': 'import-2'}]
-        }
-
-        result = manager.describe_metadata_model_imports('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert len(result['data']['metadata_model_imports']) == 2
-
-    def test_describe_metadata_model_imports_with_params(self, manager, mock_client):
-        """Test imports listing with all parameters."""
-        mock_client.call_api.return_value = {
-            'MetadataModelImports': [],
-            'Marker': 'next-token',
-        }
-
-        filters = [{'Name': 'origin', 'Values': ['source']}]
-        result = manager.describe_metadata_model_imports(
-            'arn:test', filters=filters, marker='token', max_results=20
-        )
-
-        assert result['success'] is True
-        assert 'next_marker' in result['data']
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 20
-
-    def test_start_metadata_model_import_success(self, manager, mock_client):
+    def test_start_metadata_model_import_success(self, manager, fake_client):
         """Test successful import start."""
-        mock_client.call_api.return_value = {'MetadataModelImport': {'ImportId': 'import-1'}}
+        fake_client.return_value = {'MetadataModelImport': {'ImportId': 'import-1'}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.start_metadata_model_import('arn:test', selection_rules, 'source')
+        result = manager.start_metadata_model_import('arn:test', SELECTION_RULES, 'source')
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model import started'
-        mock_client.call_api.assert_called_once_with(
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model import started'
+        )
+        assert_called_once_kw(
+            fake_client,
             'start_metadata_model_import',
             MigrationProjectArn='arn:test',
-            SelectionRules=selection_rules,
+            SelectionRules=SELECTION_RULES,
             Origin='source',
         )
 
 
+@pytest.mark.category(name='export_assessment')
 class TestMetadataModelManagerExportAssessment:
     """Test metadata model assessment export operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_export_metadata_model_assessment_success(self, manager, mock_client):
+    def test_export_metadata_model_assessment_success(self, manager, fake_client):
         """Test successful assessment export."""
-        mock_client.call_api.return_value = {
-            'MetadataModelAssessmentExport': {'ExportId': 'export-1'}
-        }
+        fake_client.return_value = {'MetadataModelAssessmentExport': {'ExportId': 'export-1'}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.export_metadata_model_assessment('arn:test', selection_rules)
+        result = manager.export_metadata_model_assessment('arn:test', SELECTION_RULES)
 
-        assert result['success'] is True
-        assert result['data']['message'] == 'Metadata model assessment exported'
-        mock_client.call_api.assert_called_once()
+        assert (
+            result['success'] is True
+            and result['data']['message'] == 'Metadata model assessment exported'
+        )
+        assert fake_client.call_count == 1
 
-    def test_export_metadata_model_assessment_with_filename(self, manager, mock_client):
+    def test_export_metadata_model_assessment_with_filename(self, manager, fake_client):
         """Test assessment export with filename."""
-        mock_client.call_api.return_value = {'MetadataModelAssessmentExport': {}}
+        fake_client.return_value = {'MetadataModelAssessmentExport': {}}
 
-        selection_rules = '{"rules": []}'
         result = manager.export_metadata_model_assessment(
-            'arn:test', selection_rules, file_name='assessment.pdf'
+            'arn:test', SELECTION_RULES, file_name='assessment.pdf'
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['FileName'] == 'assessment.pdf'
 
-    def test_export_metadata_model_assessment_with_report_types(self, manager, mock_client):
+    def test_export_metadata_model_assessment_with_report_types(self, manager, fake_client):
         """Test assessment export with report types."""
-        mock_client.call_api.return_value = {'MetadataModelAssessmentExport': {}}
+        fake_client.return_value = {'MetadataModelAssessmentExport': {}}
 
-        selection_rules = '{"rules": []}'
-        report_types = ['summary', 'detailed']
         result = manager.export_metadata_model_assessment(
-            'arn:test', selection_rules, assessment_report_types=report_types
+            'arn:test', SELECTION_RULES, assessment_report_types=list(REPORT_TYPES)
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['AssessmentReportTypes'] == report_types
+        call_args = fake_client.last_kwargs
+        assert call_args['AssessmentReportTypes'] == list(REPORT_TYPES)
 
-    def test_export_metadata_model_assessment_with_all_params(self, manager, mock_client):
+    def test_export_metadata_model_assessment_with_all_params(self, manager, fake_client):
         """Test assessment export with all parameters."""
-        mock_client.call_api.return_value = {'MetadataModelAssessmentExport': {}}
+        fake_client.return_value = {'MetadataModelAssessmentExport': {}}
 
-        selection_rules = '{"rules": []}'
-        report_types = ['summary']
         result = manager.export_metadata_model_assessment(
             'arn:test',
-            selection_rules,
+            SELECTION_RULES,
             file_name='report.pdf',
-            assessment_report_types=report_types,
+            assessment_report_types=list(REPORT_TYPES_SUMMARY),
         )
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['FileName'] == 'report.pdf'
-        assert call_args['AssessmentReportTypes'] == report_types
+        assert call_args['AssessmentReportTypes'] == list(REPORT_TYPES_SUMMARY)
 
 
+@pytest.mark.category(name='errors')
 class TestMetadataModelManagerErrorHandling:
     """Test error handling."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_conversion_configuration_api_error(self, manager, mock_client):
-        """Test API error during configuration retrieval."""
-        mock_client.call_api.side_effect = Exception('API Error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.describe_conversion_configuration('arn:test')
-
-        assert 'API Error' in str(exc_info.value)
-
-    def test_start_assessment_api_error(self, manager, mock_client):
-        """Test API error during assessment start."""
-        mock_client.call_api.side_effect = Exception('Network error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.start_metadata_model_assessment('arn:test', '{}')
-
-        assert 'Network error' in str(exc_info.value)
+    @pytest.mark.parametrize('method,args,err', ERROR_CASES, ids=[c[0] for c in ERROR_CASES])
+    def test_api_error(self, manager, fake_client, method, args, err):
+        """Test API errors propagate from each manager operation."""
+        fake_client.side_effect = Exception(err)
 
-    def test_start_conversion_api_error(self, manager, mock_client):
-        """Test API error during conversion start."""
-        mock_client.call_api.side_effect = Exception('Service error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.start_metadata_model_conversion('arn:test', '{}')
-
-        assert 'Service error' in str(exc_info.value)
+        with pytest.raises(Exception, match=err):
+            getattr(manager, method)(*args)
 
 
+@pytest.mark.category(name='edge_cases')
 class TestMetadataModelManagerEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create MetadataModelManager instance."""
-        return MetadataModelManager(mock_client)
-
-    def test_describe_assessments_empty_result(self, manager, mock_client):
-        """Test assessments listing with empty result."""
-        mock_client.call_api.return_value = {'MetadataModelAssessments': []}
-
-        result = manager.describe_metadata_model_assessments('arn:test')
-
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['metadata_model_assessments'] == []
-
-    def test_describe_conversions_max_results_boundary(self, manager, mock_client):
+    def test_describe_conversions_max_results_boundary(self, manager, fake_client):
         """Test conversions listing with maximum results."""
-        mock_client.call_api.return_value = {'MetadataModelConversions': []}
+        fake_client.return_value = {'MetadataModelConversions': []}
 
         result = manager.describe_metadata_model_conversions('arn:test', max_results=1000)
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 1000
 
-    def test_export_assessment_without_optional_params(self, manager, mock_client):
+    def test_export_assessment_without_optional_params(self, manager, fake_client):
         """Test assessment export without optional parameters."""
-        mock_client.call_api.return_value = {'MetadataModelAssessmentExport': {}}
+        fake_client.return_value = {'MetadataModelAssessmentExport': {}}
 
-        selection_rules = '{"rules": []}'
-        result = manager.export_metadata_model_assessment('arn:test', selection_rules)
+        result = manager.export_metadata_model_assessment('arn:test', SELECTION_RULES)
 
         assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        call_args = fake_client.last_kwargs
         assert 'FileName' not in call_args
         assert 'AssessmentReportTypes' not in call_args
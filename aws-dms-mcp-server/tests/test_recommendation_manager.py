@@ -16,217 +16,148 @@
 
 import pytest
 from awslabs.aws_dms_mcp_server.utils.recommendation_manager import RecommendationManager
-from unittest.mock import Mock
+from tests.utils import assert_called_once_kw, assert_ok
+
+
+pytestmark = pytest.mark.xdist_group('recommendation_manager')
+
+LIST_OPS = [
+    (
+        'list_recommendations',
+        'Recommendations',
+        'recommendations',
+        [{'Name': 'recommendation-type', 'Values': ['instance-type']}],
+    ),
+    (
+        'list_recommendation_limitations',
+        'Limitations',
+        'limitations',
+        [{'Name': 'limitation-type', 'Values': ['memory']}],
+    ),
+]
+LIST_OP_IDS = [op[0] for op in LIST_OPS]
+
+_LIST_ITEMS = [{'Id': 'item-1'}, {'Id': 'item-2'}]
+LIST_RESPONSE_CASES = [
+    pytest.param(method, data_key, {resp_key: items}, id=f'{method}-{len(items)}')
+    for method, resp_key, data_key, _ in LIST_OPS
+    for items in (_LIST_ITEMS, [])
+]
+
+ERROR_CASES = [
+    ('list_recommendations', (), 'API Error'),
+    ('list_recommendation_limitations', (), 'Network error'),
+    ('start_recommendations', ('db-1', {}), 'Start failed'),
+    ('batch_start_recommendations', ([{'DatabaseId': 'db-1', 'Settings': {}}],), 'Batch error'),
+]
+
+# Built once at import; batch_start_recommendations only forwards it.
+_LARGE_BATCH = [{'DatabaseId': f'db-{i}', 'Settings': {}} for i in range(100)]
+
+
+@pytest.fixture(scope='module')
+def manager(manager_factory, _shared_fake_client):
+    """Create RecommendationManager around the session-wide fake client."""
+    return manager_factory(RecommendationManager, _shared_fake_client)
+
+
+@pytest.fixture
+def response(request, fake_client):
+    """Install the indirectly parametrized response on the FakeClient."""
+    fake_client.return_value = request.param
+    return request.param
 
 
 class TestRecommendationManagerListOperations:
-    """Test recommendation listing operations."""
-
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
-
-    def test_list_recommendations_success(self, manager, mock_client):
-        """Test successful recommendations listing."""
-        mock_client.call_api.return_value = {
-            'Recommendations': [
-                {'RecommendationId': 'rec-1', 'Type': 'instance-type'},
-                {'RecommendationId': 'rec-2', 'Type': 'storage-optimization'},
-            ]
-        }
-
-        result = manager.list_recommendations()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert 'recommendations' in result['data']
-
-    def test_list_recommendations_with_filters(self, manager, mock_client):
-        """Test listing recommendations with filters."""
-        mock_client.call_api.return_value = {'Recommendations': []}
-
-        filters = [{'Name': 'recommendation-type', 'Values': ['instance-type']}]
-        result = manager.list_recommendations(filters=filters, max_results=50, marker='token')
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Filters'] == filters
-        assert call_args['MaxRecords'] == 50
-        assert call_args['NextToken'] == 'token'
-
-    def test_list_recommendations_with_pagination(self, manager, mock_client):
-        """Test listing recommendations with pagination."""
-        mock_client.call_api.return_value = {'Recommendations': [], 'NextToken': 'next-token'}
-
-        result = manager.list_recommendations()
-
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-        assert result['data']['next_token'] == 'next-token'
-
-    def test_list_recommendations_empty(self, manager, mock_client):
-        """Test listing recommendations with empty result."""
-        mock_client.call_api.return_value = {'Recommendations': []}
-
-        result = manager.list_recommendations()
+    """Test recommendation and limitation listing operations."""
 
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['recommendations'] == []
+    @pytest.mark.parametrize(
+        'method,data_key,response', LIST_RESPONSE_CASES, indirect=['response']
+    )
+    def test_list_items(self, manager, method, data_key, response):
+        """Test listing returns the response items and their count."""
+        (items,) = response.values()
 
-    def test_list_recommendations_without_optional_params(self, manager, mock_client):
-        """Test listing recommendations without optional parameters."""
-        mock_client.call_api.return_value = {'Recommendations': []}
+        result = getattr(manager, method)()
 
-        result = manager.list_recommendations()
+        data = assert_ok(result, count=len(items))
+        assert data[data_key] == items
+        assert 'next_token' not in data
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['MaxRecords'] == 100
-        assert 'Filters' not in call_args
-        assert 'NextToken' not in call_args
+    @pytest.mark.parametrize('method,resp_key,data_key,filters', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_with_filters(self, manager, fake_client, method, resp_key, data_key, filters):
+        """Test listing with filters."""
+        fake_client.return_value = {resp_key: []}
 
+        result = getattr(manager, method)(filters=filters, max_results=50, marker='token')
 
-class TestRecommendationManagerLimitations:
-    """Test recommendation limitations operations."""
-
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
-
-    def test_list_recommendation_limitations_success(self, manager, mock_client):
-        """Test successful limitations listing."""
-        mock_client.call_api.return_value = {
-            'Limitations': [
-                {'LimitationType': 'memory', 'MaxValue': '256GB'},
-                {'LimitationType': 'storage', 'MaxValue': '10TB'},
-            ]
-        }
-
-        result = manager.list_recommendation_limitations()
-
-        assert result['success'] is True
-        assert result['data']['count'] == 2
-        assert 'limitations' in result['data']
-
-    def test_list_recommendation_limitations_with_filters(self, manager, mock_client):
-        """Test listing limitations with filters."""
-        mock_client.call_api.return_value = {'Limitations': []}
-
-        filters = [{'Name': 'limitation-type', 'Values': ['memory']}]
-        result = manager.list_recommendation_limitations(
-            filters=filters, max_results=50, marker='token'
-        )
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
         assert call_args['Filters'] == filters
         assert call_args['MaxRecords'] == 50
         assert call_args['NextToken'] == 'token'
 
-    def test_list_recommendation_limitations_with_pagination(self, manager, mock_client):
-        """Test listing limitations with pagination."""
-        mock_client.call_api.return_value = {'Limitations': [], 'NextToken': 'next-token'}
+    @pytest.mark.parametrize('method,resp_key,data_key,filters', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_with_pagination(self, manager, fake_client, method, resp_key, data_key, filters):
+        """Test listing with pagination."""
+        fake_client.return_value = {resp_key: [], 'NextToken': 'next-token'}
 
-        result = manager.list_recommendation_limitations()
+        result = getattr(manager, method)()
 
-        assert result['success'] is True
-        assert 'next_token' in result['data']
-        assert result['data']['next_token'] == 'next-token'
+        assert_ok(result, next_token='next-token')
 
-    def test_list_recommendation_limitations_empty(self, manager, mock_client):
-        """Test listing limitations with empty result."""
-        mock_client.call_api.return_value = {'Limitations': []}
+    @pytest.mark.parametrize('method,resp_key,data_key,filters', LIST_OPS, ids=LIST_OP_IDS)
+    def test_list_without_optional_params(
+        self, manager, fake_client, method, resp_key, data_key, filters
+    ):
+        """Test listing without optional parameters."""
+        fake_client.return_value = {resp_key: []}
 
-        result = manager.list_recommendation_limitations()
+        result = getattr(manager, method)()
 
-        assert result['success'] is True
-        assert result['data']['count'] == 0
-        assert result['data']['limitations'] == []
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
+        assert call_args == {'MaxRecords': 100}
 
 
 class TestRecommendationManagerStartRecommendations:
     """Test starting recommendations operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
-
-    def test_start_recommendations_success(self, manager, mock_client):
-        """Test successful recommendations start."""
-        mock_client.call_api.return_value = {}
-
-        settings = {'AnalysisType': 'performance', 'IncludeHistoricalData': True}
-        result = manager.start_recommendations('database-123', settings)
-
-        assert result['success'] is True
-        assert result['data']['message'] == 'Recommendations generation started'
-        assert result['data']['database_id'] == 'database-123'
-        mock_client.call_api.assert_called_once_with(
-            'start_recommendations', DatabaseId='database-123', Settings=settings
+    @pytest.mark.parametrize(
+        'db_id,settings',
+        [
+            ('database-123', {'AnalysisType': 'performance', 'IncludeHistoricalData': True}),
+            ('database-456', {}),
+            (
+                'database-789',
+                {
+                    'AnalysisType': 'comprehensive',
+                    'IncludeHistoricalData': True,
+                    'TimeRangeHours': 168,
+                    'Thresholds': {'CPUUtilization': 80, 'MemoryUtilization': 75},
+                },
+            ),
+        ],
+        ids=['basic', 'minimal', 'complex'],
+    )
+    def test_start_recommendations(self, manager, fake_client, db_id, settings):
+        """Test starting recommendations forwards the database ID and settings."""
+        fake_client.return_value = {}
+
+        result = manager.start_recommendations(db_id, settings)
+
+        assert_ok(result, message='Recommendations generation started', database_id=db_id)
+        assert_called_once_kw(
+            fake_client, 'start_recommendations', DatabaseId=db_id, Settings=settings
         )
 
-    def test_start_recommendations_minimal_settings(self, manager, mock_client):
-        """Test starting recommendations with minimal settings."""
-        mock_client.call_api.return_value = {}
-
-        settings = {}
-        result = manager.start_recommendations('database-456', settings)
-
-        assert result['success'] is True
-        assert result['data']['database_id'] == 'database-456'
-
-    def test_start_recommendations_complex_settings(self, manager, mock_client):
-        """Test starting recommendations with complex settings."""
-        mock_client.call_api.return_value = {}
-
-        settings = {
-            'AnalysisType': 'comprehensive',
-            'IncludeHistoricalData': True,
-            'TimeRangeHours': 168,
-            'Thresholds': {'CPUUtilization': 80, 'MemoryUtilization': 75},
-        }
-        result = manager.start_recommendations('database-789', settings)
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        assert call_args['Settings'] == settings
-
 
 class TestRecommendationManagerBatchOperations:
     """Test batch recommendations operations."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
-
-    def test_batch_start_recommendations_success(self, manager, mock_client):
+    def test_batch_start_recommendations_success(self, manager, fake_client):
         """Test successful batch recommendations start."""
-        mock_client.call_api.return_value = {'ErrorEntries': []}
+        fake_client.return_value = {'ErrorEntries': []}
 
         data = [
             {'DatabaseId': 'db-1', 'Settings': {'AnalysisType': 'performance'}},
@@ -234,13 +165,12 @@ class TestRecommendationManagerBatchOperations:
         ]
         result = manager.batch_start_recommendations(data)
 
-        assert result['success'] is True
-        assert result['data']['error_entries'] == []
-        assert 'Batch recommendations started' in result['data']['message']
+        data = assert_ok(result, error_entries=[])
+        assert 'Batch recommendations started' in data['message']
 
-    def test_batch_start_recommendations_with_errors(self, manager, mock_client):
+    def test_batch_start_recommendations_with_errors(self, manager, fake_client):
         """Test batch recommendations with errors."""
-        mock_client.call_api.return_value = {
+        fake_client.return_value = {
             'ErrorEntries': [
                 {'DatabaseId': 'db-1', 'ErrorMessage': 'Database not found'},
                 {'DatabaseId': 'db-3', 'ErrorMessage': 'Invalid settings'},
@@ -258,158 +188,93 @@ class TestRecommendationManagerBatchOperations:
         assert len(result['data']['error_entries']) == 2
         assert 'errors: 2' in result['data']['message']
 
-    def test_batch_start_recommendations_empty_data(self, manager, mock_client):
-        """Test batch recommendations with empty data."""
-        mock_client.call_api.return_value = {'ErrorEntries': []}
-
-        result = manager.batch_start_recommendations([])
+    @pytest.mark.parametrize('payload', [[], None], ids=['empty', 'none'])
+    def test_batch_start_recommendations_no_data(self, manager, fake_client, payload):
+        """Test batch recommendations without data omit the Data parameter."""
+        fake_client.return_value = {'ErrorEntries': []}
 
-        assert result['success'] is True
-        # Empty list is still passed as Data parameter
-        mock_client.call_api.assert_called_once()
+        result = manager.batch_start_recommendations(payload)
 
-    def test_batch_start_recommendations_none_data(self, manager, mock_client):
-        """Test batch recommendations with None data."""
-        mock_client.call_api.return_value = {'ErrorEntries': []}
+        assert_ok(result)
+        assert fake_client.last_args == ('batch_start_recommendations',)
+        assert fake_client.last_kwargs == {}
 
-        result = manager.batch_start_recommendations(None)
-
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
-        # When data is None, Data key should not be present
-        assert 'Data' not in call_args
-
-    def test_batch_start_recommendations_single_database(self, manager, mock_client):
+    def test_batch_start_recommendations_single_database(self, manager, fake_client):
         """Test batch recommendations with single database."""
-        mock_client.call_api.return_value = {'ErrorEntries': []}
+        fake_client.return_value = {'ErrorEntries': []}
 
         data = [{'DatabaseId': 'db-1', 'Settings': {'AnalysisType': 'comprehensive'}}]
         result = manager.batch_start_recommendations(data)
 
-        assert result['success'] is True
-        assert len(result['data']['error_entries']) == 0
+        assert_ok(result, error_entries=[])
 
 
 class TestRecommendationManagerErrorHandling:
     """Test error handling."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
+    @pytest.mark.parametrize('method,args,err', ERROR_CASES, ids=[c[0] for c in ERROR_CASES])
+    def test_api_error(self, manager, fake_client, method, args, err):
+        """Test API errors propagate from each manager operation."""
+        fake_client.side_effect = Exception(err)
 
-    def test_list_recommendations_api_error(self, manager, mock_client):
-        """Test API error during recommendations listing."""
-        mock_client.call_api.side_effect = Exception('API Error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.list_recommendations()
-
-        assert 'API Error' in str(exc_info.value)
-
-    def test_list_recommendation_limitations_api_error(self, manager, mock_client):
-        """Test API error during limitations listing."""
-        mock_client.call_api.side_effect = Exception('Network error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.list_recommendation_limitations()
-
-        assert 'Network error' in str(exc_info.value)
-
-    def test_start_recommendations_api_error(self, manager, mock_client):
-        """Test API error during recommendations start."""
-        mock_client.call_api.side_effect = Exception('Start failed')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.start_recommendations('db-1', {})
-
-        assert 'Start failed' in str(exc_info.value)
-
-    def test_batch_start_recommendations_api_error(self, manager, mock_client):
-        """Test API error during batch recommendations start."""
-        mock_client.call_api.side_effect = Exception('Batch error')
-
-        with pytest.raises(Exception) as exc_info:
-            manager.batch_start_recommendations([{'DatabaseId': 'db-1', 'Settings': {}}])
-
-        assert 'Batch error' in str(exc_info.value)
+        with pytest.raises(Exception, match=err):
+            getattr(manager, method)(*args)
 
 
 class TestRecommendationManagerEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock DMS client."""
-        return Mock()
-
-    @pytest.fixture
-    def manager(self, mock_client):
-        """Create RecommendationManager instance."""
-        return RecommendationManager(mock_client)
-
-    def test_list_recommendations_with_max_results_boundary(self, manager, mock_client):
+    def test_list_recommendations_with_max_results_boundary(self, manager, fake_client):
         """Test list recommendations with maximum results."""
-        mock_client.call_api.return_value = {'Recommendations': []}
+        fake_client.return_value = {'Recommendations': []}
 
         result = manager.list_recommendations(max_results=1000)
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
         assert call_args['MaxRecords'] == 1000
 
-    def test_list_recommendations_multiple_pages(self, manager, mock_client):
+    def test_list_recommendations_multiple_pages(self, manager, fake_client):
         """Test listing recommendations across multiple pages."""
         # First call
-        mock_client.call_api.return_value = {
+        fake_client.return_value = {
             'Recommendations': [{'RecommendationId': 'rec-1'}],
             'NextToken': 'token-1',
         }
 
         result1 = manager.list_recommendations()
 
-        assert result1['success'] is True
-        assert result1['data']['count'] == 1
-        assert result1['data']['next_token'] == 'token-1'
+        assert_ok(result1, count=1, next_token='token-1')
 
         # Second call with token
-        mock_client.call_api.return_value = {'Recommendations': [{'RecommendationId': 'rec-2'}]}
+        fake_client.return_value = {'Recommendations': [{'RecommendationId': 'rec-2'}]}
 
         result2 = manager.list_recommendations(marker='token-1')
 
-        assert result2['success'] is True
-        assert result2['data']['count'] == 1
-        assert 'next_token' not in result2['data']
+        data2 = assert_ok(result2, count=1)
+        assert 'next_token' not in data2
 
-    def test_batch_start_with_large_dataset(self, manager, mock_client):
+    def test_batch_start_with_large_dataset(self, manager, fake_client):
         """Test batch start with large dataset."""
-        mock_client.call_api.return_value = {'ErrorEntries': []}
+        fake_client.return_value = {'ErrorEntries': []}
 
-        # Create large dataset
-        data = [{'DatabaseId': f'db-{i}', 'Settings': {}} for i in range(100)]
-        result = manager.batch_start_recommendations(data)
+        result = manager.batch_start_recommendations(_LARGE_BATCH)
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
         assert len(call_args['Data']) == 100
 
-    def test_start_recommendations_with_empty_database_id(self, manager, mock_client):
+    def test_start_recommendations_with_empty_database_id(self, manager, fake_client):
         """Test starting recommendations with empty database ID."""
-        mock_client.call_api.return_value = {}
+        fake_client.return_value = {}
 
         result = manager.start_recommendations('', {})
 
-        assert result['success'] is True
-        assert result['data']['database_id'] == ''
+        assert_ok(result, database_id='')
 
-    def test_batch_partial_errors(self, manager, mock_client):
+    def test_batch_partial_errors(self, manager, fake_client):
         """Test batch recommendations with partial errors."""
-        mock_client.call_api.return_value = {
+        fake_client.return_value = {
             'ErrorEntries': [{'DatabaseId': 'db-2', 'ErrorMessage': 'Invalid'}]
         }
 
@@ -424,9 +289,9 @@ class TestRecommendationManagerEdgeCases:
         assert len(result['data']['error_entries']) == 1
         assert 'errors: 1' in result['data']['message']
 
-    def test_list_limitations_with_all_optional_params(self, manager, mock_client):
+    def test_list_limitations_with_all_optional_params(self, manager, fake_client):
         """Test listing limitations with all optional parameters."""
-        mock_client.call_api.return_value = {'Limitations': []}
+        fake_client.return_value = {'Limitations': []}
 
         filters = [
             {'Name': 'limitation-type', 'Values': ['memory', 'storage']},
@@ -436,15 +301,15 @@ class TestRecommendationManagerEdgeCases:
             filters=filters, max_results=25, marker='custom-token'
         )
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
         assert call_args['Filters'] == filters
         assert call_args['MaxRecords'] == 25
         assert call_args['NextToken'] == 'custom-token'
 
-    def test_start_recommendations_settings_preservation(self, manager, mock_client):
+    def test_start_recommendations_settings_preservation(self, manager, fake_client):
         """Test that settings are preserved in start_recommendations."""
-        mock_client.call_api.return_value = {}
+        fake_client.return_value = {}
 
         original_settings = {
             'AnalysisType': 'comprehensive',
@@ -452,7 +317,7 @@ class TestRecommendationManagerEdgeCases:
         }
         result = manager.start_recommendations('db-1', original_settings)
 
-        assert result['success'] is True
-        call_args = mock_client.call_api.call_args[1]
+        assert_ok(result)
+        call_args = fake_client.last_kwargs
         assert call_args['Settings'] == original_settings
         assert call_args['Settings']['NestedObject']['Number'] == 42
@@ -0,0 +1,67 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Integration tests for server tool handlers against moto's DMS backend.
+
+Unlike test_server_integration.py, requests go through real boto3 request
+serialization and response parsing.
+"""
+
+import pytest
+from awslabs.aws_dms_mcp_server.config import DMSServerConfig
+
+
+moto = pytest.importorskip('moto')
+
+pytestmark = pytest.mark.xdist_group('server_moto')
+
+TASK_ID = 'moto-task'
+
+
+@pytest.fixture(scope='module')
+def moto_dms():
+    """Serve DMS from moto for the module, seeded with one replication task."""
+    import boto3
+
+    with moto.mock_aws():
+        client = boto3.client('dms', region_name='us-east-1')
+        client.create_replication_task(
+            ReplicationTaskIdentifier=TASK_ID,
+            SourceEndpointArn='arn:aws:dms:us-east-1:123456789012:endpoint:SRC',
+            TargetEndpointArn='arn:aws:dms:us-east-1:123456789012:endpoint:TGT',
+            ReplicationInstanceArn='arn:aws:dms:us-east-1:123456789012:rep:INST',
+            MigrationType='full-load',
+            TableMappings='{"rules": []}',
+        )
+        yield client
+
+
+@pytest.fixture
+def server(server_mod, moto_dms):
+    """Provide the server module configured in writable mode against moto."""
+    server_mod.create_server(
+        DMSServerConfig(aws_region='us-east-1', read_only_mode=False, log_level='ERROR')
+    )
+    return server_mod
+
+
+class TestReplicationTaskToolsMoto:
+    """Replication task handlers backed by moto."""
+
+    def test_describe_replication_tasks(self, server):
+        """Test the seeded task is returned by describe_replication_tasks."""
+        result = server.describe_replication_tasks()
+
+        assert result['success'] is True
+        assert [task['identifier'] for task in result['data']['tasks']] == [TASK_ID]
@@ -1,3 +1,94 @@
 """
 Test utilities.
 """
+
+from typing import Any, Dict, Optional, Tuple
+
+
+def assert_ok(result: Dict[str, Any], /, **expected_data: Any) -> Dict[str, Any]:
+    """Assert that a manager result succeeded and its data matches expectations.
+
+    Args:
+        result: Manager response dictionary
+        **expected_data: Expected values keyed by field name in ``result['data']``
+
+    Returns:
+        The ``data`` payload of the result
+    """
+    assert result['success'] is True
+    data = result['data']
+    for key, value in expected_data.items():
+        assert data[key] == value
+    return data
+
+
+def assert_called_once_kw(client: 'FakeClient', name: str, /, **kwargs: Any) -> None:
+    """Assert a FakeClient saw exactly one call_api call with the given operation and kwargs.
+
+    Args:
+        client: The ``FakeClient`` to inspect
+        name: Expected DMS operation name
+        **kwargs: Expected keyword arguments
+    """
+    assert client.call_count == 1
+    assert client.last_args == (name,)
+    assert client.last_kwargs == kwargs
+
+
+class FakeClient:
+    """Lightweight stand-in for DMSClient that records the last call_api invocation.
+
+    Much cheaper than a Mock for tests that only need canned responses and
+    the arguments of the most recent call.
+    """
+
+    __slots__ = ('return_value', 'side_effect', 'last_args', 'last_kwargs', 'call_count')
+
+    def __init__(self) -> None:
+        """Initialize an empty fake client."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the canned response, side effect and recorded calls."""
+        self.return_value: Any = {}
+        self.side_effect: Optional[BaseException] = None
+        self.last_args: Tuple[Any, ...] = ()
+        self.last_kwargs: Dict[str, Any] = {}
+        self.call_count = 0
+
+    @property
+    def last_op(self) -> Optional[str]:
+        """Name of the most recently requested DMS operation."""
+        return self.last_args[0] if self.last_args else None
+
+    def call_api(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and return the canned response or raise the side effect."""
+        self.call_count += 1
+        self.last_args = args
+        self.last_kwargs = kwargs
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class ToolHandlers:
+    """View of a server module that exposes MCP tool handlers as plain functions.
+
+    Depending on the FastMCP version, ``@mcp.tool()`` returns either the
+    decorated function itself or a tool object holding it in ``fn``.
+    """
+
+    __slots__ = ('_module',)
+
+    def __init__(self, module: Any) -> None:
+        """Wrap the server module.
+
+        Args:
+            module: Module defining the ``@mcp.tool()`` handlers
+        """
+        self._module = module
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the module attribute, unwrapped if it is a tool object."""
+        attr = getattr(self._module, name)
+        return getattr(attr, 'fn', attr)